@@ -0,0 +1,3 @@
+from .azure_ocr import AzureOCR
+
+__all__ = ["AzureOCR"]
@@ -1,9 +1,15 @@
-from pydantic import BaseModel
+from collections import defaultdict
+from typing import Any
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 class AzureDocIntelTableCell(BaseModel):
     """
     Azure Document Intelligence Table Cell
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     row_index: int
     column_index: int
     is_header: bool
@@ -14,9 +20,24 @@ class AzureDocIntelTable(BaseModel):
     """
     Azure Document Intelligence Table
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     row_count: int
     column_count: int
-    cells: list[AzureDocIntelTableCell]
+    cells: tuple[AzureDocIntelTableCell, ...]
+
+    # row/column number -> cells, built once in model_post_init. Safe to cache as the table is frozen.
+    _by_row: dict[int, list[AzureDocIntelTableCell]] = PrivateAttr(default_factory=dict)
+    _by_col: dict[int, list[AzureDocIntelTableCell]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, context: Any, /) -> None:
+        by_row = defaultdict(list)
+        by_col = defaultdict(list)
+        for cell in self.cells:
+            by_row[cell.row_index].append(cell)
+            by_col[cell.column_index].append(cell)
+        self._by_row = dict(by_row)
+        self._by_col = dict(by_col)
 
     def get_row(self, row_num: int) -> list[AzureDocIntelTableCell]:
         """Given a row number, return a list of cells in the row.
@@ -27,7 +48,7 @@ class AzureDocIntelTable(BaseModel):
         Returns:
             list: A list of cells in the row.
         """
-        return [cell for cell in self.cells if cell.row_index == row_num]
+        return list(self._by_row.get(row_num, []))
 
     def get_column(self, col_num: int) -> list[AzureDocIntelTableCell]:
         """Given a column number, return a list of cells in the column.
@@ -38,4 +59,78 @@ class AzureDocIntelTable(BaseModel):
         Returns:
             list: A list of cells in the column.
         """
-        return [cell for cell in self.cells if cell.column_index == col_num]
\ No newline at end of file
+        return list(self._by_col.get(col_num, []))
+
+class AzureDocIntelPage(BaseModel):
+    """
+    Azure Document Intelligence Page, stored as one array per field instead of one dict per word, line and
+    selection mark
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    word_content: np.ndarray  # object
+    word_confidence: np.ndarray  # float32
+    line_content: np.ndarray  # object
+    selection_mark_state: np.ndarray  # bool, True if selected
+    selection_mark_confidence: np.ndarray  # float32
+
+    @classmethod
+    def from_page(cls, page: dict) -> "AzureDocIntelPage":
+        """Given a page from an Azure OCR result, convert its words, lines and selection marks to arrays.
+
+        Args:
+            page (dict): The page found in the Azure OCR result.
+
+        Returns:
+            AzureDocIntelPage: The page stored as arrays.
+        """
+        words = page.get("words", [])
+        lines = page.get("lines", [])
+        selection_marks = page.get("selectionMarks", [])
+        word_confidence = np.fromiter((word["confidence"] for word in words), dtype=np.float32, count=len(words))
+        selection_mark_confidence = np.fromiter(
+            (selection_mark["confidence"] for selection_mark in selection_marks),
+            dtype=np.float32,
+            count=len(selection_marks),
+        )
+        return cls(
+            word_content=np.array([word["content"] for word in words], dtype=object),
+            word_confidence=word_confidence,
+            line_content=np.array([line["content"] for line in lines], dtype=object),
+            selection_mark_state=np.fromiter(
+                (selection_mark["state"] == "selected" for selection_mark in selection_marks),
+                dtype=bool,
+                count=len(selection_marks),
+            ),
+            selection_mark_confidence=selection_mark_confidence,
+        )
+
+    def get_words(self, minimal_confidence: float) -> np.ndarray:
+        """Given a minimal confidence, return the contents of the words at or above it.
+
+        Args:
+            minimal_confidence (float): The minimal confidence level to extract words.
+
+        Returns:
+            np.ndarray: The contents (object) of the words at or above the minimal confidence.
+        """
+        return self.word_content[self.word_confidence >= np.float32(minimal_confidence)]
+
+    def get_selection_marks(self, minimal_confidence: float) -> np.ndarray:
+        """Given a minimal confidence, return the states of the selection marks at or above it.
+
+        Args:
+            minimal_confidence (float): The minimal confidence level to extract selection marks.
+
+        Returns:
+            np.ndarray: The states (bool, True if selected) of the selection marks at or above the minimal confidence.
+        """
+        return self.selection_mark_state[self.selection_mark_confidence >= np.float32(minimal_confidence)]
+
+class AzureDocIntelPageContents(BaseModel):
+    """
+    Azure Document Intelligence words, lines and selection marks found in one or more pages
+    """
+    words: list[str] = []
+    lines: list[str] = []
+    selection_marks: list[bool] = []
\ No newline at end of file
@@ -1,14 +1,26 @@
 from azure.core.credentials import AzureKeyCredential
+from azure.core.pipeline.transport import RequestsTransport
 from azure.ai.documentintelligence import DocumentIntelligenceClient
 from azure.ai.documentintelligence.models import AnalyzeResult
 from azure.ai.documentintelligence.models import AnalyzeDocumentRequest
 
-from ._models import AzureDocIntelTableCell, AzureDocIntelTable
+from ._models import AzureDocIntelTableCell, AzureDocIntelTable, AzureDocIntelPage, AzureDocIntelPageContents
 
-from functools import wraps
-import json
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial, wraps
+from operator import itemgetter
+from typing import ClassVar
+import mmap
 import os
 
+import ijson
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+import simdjson
+from urllib3.util.retry import Retry
+
 def require_azure_ocr_result(func):
     """
         Decorator that checks if `self.result` exists before executing the wrapped function.
@@ -23,10 +35,34 @@ def require_azure_ocr_result(func):
     return wrapper
 
 class AzureOCR:
+    # modelId -> function extracting the raw text from the root of the Azure OCR result (see __build_indices)
+    _RAW_TEXT_EXTRACTORS: ClassVar[dict[str, Callable[[dict], str]]] = {
+        "prebuilt-document": itemgetter("content"),
+        "prebuilt-layout": itemgetter("content"),
+    }
+
+    # size of the connection pool shared by every DocumentIntelligenceClient, for concurrent multi document pipelines
+    HTTP_POOL_MAXSIZE: ClassVar[int] = 64
+    # (endpoint, api_key) -> client, so AzureOCR instances for the same resource reuse one HTTP pipeline
+    _client_cache: ClassVar[dict[tuple[str, str], DocumentIntelligenceClient]] = {}
+    _session: ClassVar[requests.Session | None] = None
+
     def __init__(self, endpoint: str, api_key: str):
-        self.__doc_intel_client = DocumentIntelligenceClient(endpoint, AzureKeyCredential(api_key))
+        self.__doc_intel_client = self.__get_doc_intel_client(endpoint, api_key)
         self.result = None
         self.max_page_count = 1
+        # key -> callable returning a fresh generator over the items of that key, see load_azure_ocr_json_streaming
+        self._streams = {}
+        # effective root of `self.result`, cached once per result by __build_indices
+        self._root = None
+        # key ("pages", "tables", "keyValuePairs") -> page number -> items on that page, built by __build_indices
+        self._page_indices = {}
+        # page number -> page converted to arrays, built the first time the page is read
+        self._page_arrays = {}
+        # raw text of the result, extracted the first time get_raw_text is called
+        self._raw_text_cache = None
+        # raw JSON body of the analyze response, so save_azure_ocr_json can write it without converting `self.result`
+        self._raw_json_bytes = None
 
     def analyze_document(self, file: str, language: str = "en", model_id: str = "prebuilt-document") -> None:
         """Takes a filename as input, run OCR on it and stores the resulting object in `self.result`.
@@ -41,19 +77,30 @@ class AzureOCR:
         Returns:
             None
         """
+        # read the document in a single call (the buffer is sized from the file size) and upload it as one bytes
+        # object, instead of letting the request body be read from the file handle chunk by chunk
         with open(file, "rb") as f:
-            # TODO: support URL as input
-            poller = self.__doc_intel_client.begin_analyze_document(
-                model_id=model_id, analyze_request=f, content_type="application/octet-stream", locale=language
-            )
-            self.result = poller.result()
-            self.__update_max_page_count()
+            document = f.read()
+
+        # TODO: support URL as input
+        poller = self.__doc_intel_client.begin_analyze_document(
+            model_id=model_id,
+            body=document,
+            content_type="application/octet-stream",
+            locale=language,
+            cls=self.__keep_raw_response,
+        )
+        self.result, self._raw_json_bytes = poller.result()
+        self._streams = {}
+        self.__build_indices()
 
 
 
     def load_azure_ocr_json(self, filename: str) -> None:
         """Load an Azure OCR JSON file and stores the resulting object in `self.result`.
 
+        NOTE: `self.result` is a lazy simdjson object, values are only converted to python objects when accessed.
+
         Args:
             filename (str): The filename of the Azure OCR JSON file.
 
@@ -67,16 +114,88 @@ class AzureOCR:
         if not os.path.exists(filename):
             raise FileNotFoundError(f"The file {filename} does not exist.")
 
-        with open(filename, "r") as f:
-            self.result = json.load(f)
+        # below this size, setting up the memory map costs more than reading the file
+        MMAP_MIN_FILE_SIZE = 1024 * 1024
+
+        # NOTE: each load gets its own parser, as the lazy result keeps a reference to the parser's document
+        parser = simdjson.Parser()
+        with open(filename, "rb") as f:
+            if os.fstat(f.fileno()).st_size < MMAP_MIN_FILE_SIZE:
+                self.result = parser.parse(f.read())
+            else:
+                # let the OS page the file in instead of copying it into an intermediate bytes object, simdjson copies
+                # what it needs into its own buffers so the map can be closed right away
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    self.result = parser.parse(mm)
+        self._streams = {}
+        self._raw_json_bytes = None
+        self.__build_indices()
 
         # if "analyzeResult" not in self.result:
         #     raise ValueError("The JSON file does not contain an 'analyzeResult' key. This is not a valid Azure OCR JSON file.")
 
+    def load_azure_ocr_json_streaming(
+        self, filename: str, needed: tuple[str, ...] = ("pages", "tables", "keyValuePairs")
+    ) -> None:
+        """Load an Azure OCR JSON file without building the full object in memory, meant for very large results.
+
+        Only the scalar values (content, modelId, ...) are stored in `self.result`. The arrays listed in `needed` are
+        streamed from the file one item at a time every time a getter accesses them, any other array is skipped.
+
+        Args:
+            filename (str): The filename of the Azure OCR JSON file.
+            needed (tuple[str, ...], optional): The arrays to stream. Defaults to ("pages", "tables", "keyValuePairs").
+
+        Returns:
+            None
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+
+        if not os.path.exists(filename):
+            raise FileNotFoundError(f"The file {filename} does not exist.")
+
+        ANALYZE_RESULT_STR = "analyzeResult"
+
+        PAGE_NUMBER_PREFIXES = ("pages.item.pageNumber", f"{ANALYZE_RESULT_STR}.pages.item.pageNumber")
+
+        result = {}
+        analyze_result = {}
+        has_analyze_result = False
+        max_page_count = 1
+        with open(filename, "rb") as f:
+            # walk the parser events once and only keep the scalars at the root (or analyzeResult) level, along with
+            # the page numbers so the pages don't have to be streamed just to count them
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if event == "map_key" and prefix == "" and value == ANALYZE_RESULT_STR:
+                    has_analyze_result = True
+                elif event in ("string", "number", "boolean", "null"):
+                    key_path = prefix.split(".")
+                    if len(key_path) == 1:
+                        result[prefix] = value
+                    elif len(key_path) == 2 and key_path[0] == ANALYZE_RESULT_STR:
+                        analyze_result[key_path[1]] = value
+                    elif prefix in PAGE_NUMBER_PREFIXES:
+                        max_page_count = max(max_page_count, value)
+
+        items_prefix = ""
+        if has_analyze_result:
+            result[ANALYZE_RESULT_STR] = analyze_result
+            items_prefix = f"{ANALYZE_RESULT_STR}."
+
+        self.result = result
+        self._streams = {key: partial(self.__stream_items, filename, f"{items_prefix}{key}.item") for key in needed}
+        self._raw_json_bytes = None
+        self.__build_indices()
+        self.max_page_count = max_page_count
+
     @require_azure_ocr_result
     def save_azure_ocr_json(self, filename: str) -> None:
         """Save an Azure OCR dict object and save it as a json.
 
+        NOTE: If the result comes from `analyze_document`, the raw response body is written as is.
+
         Args:
             filename (str): The filename of the json you want to save to.
 
@@ -84,53 +203,231 @@ class AzureOCR:
             None
 
         Raises:
-            ValueError: If no Azure OCR result was found.
+            ValueError: If no Azure OCR result was found, or if it was loaded with `load_azure_ocr_json_streaming`.
         """
-        with open(filename, "w") as f:
-            json.dump(self.result.as_dict(), f, indent=4)
+        if self._streams:
+            # only the scalars of a streamed result are in memory, saving it would silently drop its arrays
+            raise ValueError("Cannot save an Azure OCR result loaded with load_azure_ocr_json_streaming.")
+
+        if self._raw_json_bytes is not None:
+            with open(filename, "wb") as f:
+                f.write(self._raw_json_bytes)
+            return
+
+        # the SDK AnalyzeResult and the lazy simdjson object need to be converted
+        result = self.result.as_dict() if hasattr(self.result, "as_dict") else self.result
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
 
     # --------------------------
     # Helper Functions
     # ---------------------------
+    @classmethod
+    def __get_doc_intel_client(cls, endpoint: str, api_key: str) -> DocumentIntelligenceClient:
+        """Given an endpoint and an API key, return the cached Document Intelligence client, creating it on first use.
+        All clients share one requests session, so connections (and TLS sessions) are pooled across clients.
+
+        Args:
+            endpoint (str): The Azure Document Intelligence endpoint.
+            api_key (str): The Azure Document Intelligence API key.
+
+        Returns:
+            DocumentIntelligenceClient: The client for the endpoint and API key.
+        """
+        client_key = (endpoint, api_key)
+        if client_key not in cls._client_cache:
+            if cls._session is None:
+                cls._session = requests.Session()
+                # the azure pipeline already retries, same as the default RequestsTransport session
+                adapter = HTTPAdapter(
+                    pool_maxsize=cls.HTTP_POOL_MAXSIZE,
+                    max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+                )
+                for protocol in ("http://", "https://"):
+                    cls._session.mount(protocol, adapter)
+
+            cls._client_cache[client_key] = DocumentIntelligenceClient(
+                endpoint,
+                AzureKeyCredential(api_key),
+                transport=RequestsTransport(session=cls._session, session_owner=False),
+            )
+        return cls._client_cache[client_key]
+
+    @staticmethod
+    def __keep_raw_response(pipeline_response, deserialized: AnalyzeResult, response_headers: dict) -> tuple:
+        """Callback for `begin_analyze_document` returning the deserialized result along with the raw response body.
+
+        Args:
+            pipeline_response: The final response of the analyze operation.
+            deserialized (AnalyzeResult): The deserialized Azure OCR result.
+            response_headers (dict): The headers of the final response.
+
+        Returns:
+            tuple: The deserialized result and the raw JSON bytes of the response.
+        """
+        return deserialized, pipeline_response.http_response.body()
+
+    @staticmethod
+    def __stream_items(filename: str, prefix: str) -> Iterator[dict]:
+        """Given a filename and an ijson prefix, lazily yield the items found at the prefix in the file.
+
+        Args:
+            filename (str): The filename of the Azure OCR JSON file.
+            prefix (str): The ijson prefix of the items, e.g. "analyzeResult.pages.item".
+
+        Returns:
+            Iterator[dict]: A generator over the items found at the prefix.
+        """
+        with open(filename, "rb") as f:
+            yield from ijson.items(f, prefix, use_float=True)
+
     @require_azure_ocr_result
-    def __get_nested_obj_for_key(self, key: str) -> dict | None:
+    def __get_nested_obj_for_key(self, key: str) -> dict | Iterator[dict] | None:
         """Given a key, return the nested object found (max depth 1) in the Azure OCR result. If none is found,
         return None.
 
         NOTE: Assumes `self.result` is not None
+        NOTE: If the result was loaded with `load_azure_ocr_json_streaming`, a generator over the streamed items is
+              returned instead.
         Args:
             key (str): The key you want to search for in the Azure OCR result.
 
         Returns:
-            dict | None: The nested object with the key, or None if we can't find it in self.result["anaylzeResult"]
-                         or self.result.
+            dict | Iterator[dict] | None: The nested object with the key, or None if we can't find it in
+                                          self.result["anaylzeResult"] or self.result.
         """
         # TODO: handle nested objects with more than 1 depth
 
-        ANALYZE_RESULT_STR = "analyzeResult"
+        if key in self._streams:
+            return self._streams[key]()
+        return self._root.get(key)
+
+    @staticmethod
+    def __get_item_page_number(key: str, item: dict) -> int | None:
+        """Given a key and one of its items, return the page number the item is found on.
+
+        Args:
+            key (str): The key of the items in the Azure OCR result, e.g. "pages" or "tables".
+            item (dict): The item found in the Azure OCR result.
 
-        found_nested_obj = None
-        if ANALYZE_RESULT_STR in self.result:
-            if key in self.result[ANALYZE_RESULT_STR]:
-                found_nested_obj = self.result[ANALYZE_RESULT_STR][key]
-        else:
-            if key in self.result:
-                found_nested_obj = self.result[key]
-        return found_nested_obj
+        Returns:
+            int | None: The page number of the item, or None if the item has no bounding regions (e.g. results of
+                        Office documents).
+        """
+        if key == "pages":
+            return item["pageNumber"]
+        if key == "keyValuePairs":
+            # the bounding regions of a key value pair are stored on its key
+            item = item["key"]
+        # TODO: check if there is every a case where an item spans multiple pages
+        bounding_regions = item.get("boundingRegions")
+        if not bounding_regions:
+            return None
+        return bounding_regions[0]["pageNumber"]
 
     @require_azure_ocr_result
-    def __update_max_page_count(self) -> None:
-        """Return the maximum page count found in the Azure OCR result.
+    def __build_indices(self) -> None:
+        """Cache the effective root of the Azure OCR result (`self.result["analyzeResult"]` or `self.result`),
+        index its pages, tables and key value pairs by page number, so the getters don't have to scan every item on
+        every call, and update `self.max_page_count`.
+
+        NOTE: Must be called every time `self.result` is set.
+        NOTE: Streamed keys are not indexed, as it would require keeping all of their items in memory.
+        NOTE: Items without bounding regions are not on any page, they are only returned for page -1.
 
         Returns:
-            int: The maximum page count found in the Azure OCR result.
+            None
         """
-        # self.max_page_count
-        max_page_count = 1
-        if pages := self.__get_nested_obj_for_key("pages"):
-            max_page_count = max([page["page"] for page in pages])
+        self._root = self.result.get("analyzeResult", self.result)
+        self._page_arrays = {}
+        self._raw_text_cache = None
+
+        self._page_indices = {}
+        for key in ("pages", "tables", "keyValuePairs"):
+            if key in self._streams:
+                continue
+            index = defaultdict(list)
+            for item in self._root.get(key, []):
+                item_page_number = self.__get_item_page_number(key, item)
+                if item_page_number is not None:
+                    index[item_page_number].append(item)
+            self._page_indices[key] = dict(index)
+
+        # the page numbers of streamed pages are collected by load_azure_ocr_json_streaming instead
+        if "pages" in self._page_indices:
+            self.max_page_count = max(self._page_indices["pages"], default=1)
 
-        self.max_page_count = max_page_count
+    @require_azure_ocr_result
+    def __get_items_from_page(self, key: str, page_number: int) -> Iterable[dict]:
+        """Given a key and a page number, return the items of the key found on the page.
+
+        Args:
+            key (str): The key of the items in the Azure OCR result, e.g. "pages" or "tables".
+            page_number (int): The page number of the items. -1 to get all pages.
+
+        Returns:
+            Iterable[dict]: The items found on the page.
+        """
+        if page_number == -1:
+            return self.__get_nested_obj_for_key(key) or []
+        if key in self._page_indices:
+            return self._page_indices[key].get(page_number, [])
+        # streamed items are not indexed, fall back to scanning them
+        return (
+            item
+            for item in self.__get_nested_obj_for_key(key) or []
+            if self.__get_item_page_number(key, item) == page_number
+        )
+
+    def __get_page_arrays(self, page: dict) -> AzureDocIntelPage:
+        """Given a page, return its words, lines and selection marks as arrays. The arrays are cached by page number,
+        so repeated calls only pay for the conversion once.
+
+        Args:
+            page (dict): The page found in the Azure OCR result.
+
+        Returns:
+            AzureDocIntelPage: The page stored as arrays.
+        """
+        page_number = page["pageNumber"]
+        if page_number not in self._page_arrays:
+            self._page_arrays[page_number] = AzureDocIntelPage.from_page(page)
+        return self._page_arrays[page_number]
+
+    def __iter_page_arrays(self, page_number: int) -> Iterator[AzureDocIntelPage]:
+        """Given a page number, yield the pages found as arrays.
+
+        Args:
+            page_number (int): The page number to get. -1 to get all pages.
+
+        Returns:
+            Iterator[AzureDocIntelPage]: The pages stored as arrays.
+        """
+        if page_number in self._page_arrays:
+            # already converted, no need to look up (or stream) the page again
+            yield self._page_arrays[page_number]
+            return
+
+        for page in self.__get_items_from_page("pages", page_number):
+            yield self.__get_page_arrays(page)
+
+    def __check_page_number(self, page_number: int) -> None:
+        """Given a page number, raise if it is neither -1 nor a page of the Azure OCR result.
+
+        Args:
+            page_number (int): The page number to check. -1 for all pages.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the page number is invalid.
+        """
+        if page_number != -1:
+            if (page_number == 0 or
+                    page_number < -1 or
+                    page_number > self.max_page_count):
+                raise ValueError(f"Invalid page number. Page number must be between 1 and {self.max_page_count}.")
 
     # --------------------------
     # Page Functions
@@ -151,12 +448,93 @@ class AzureOCR:
             str: the raw string produced from Azure Document Intelligence OCR.
         """
         # TODO: handle the various prebuilt models and how they store content.
-        if self.result["modelId"] == "prebuilt-document":
-            return self.result["analyzeResult"]["content"]
-        elif self.result["modelId"] == "prebuilt-layout":
-            return self.result["content"]
-        else:
-            raise ValueError("Non Implemented model_id found in Azure OCR result.")
+        if self._raw_text_cache is None:
+            try:
+                extract_raw_text = self._RAW_TEXT_EXTRACTORS[self._root["modelId"]]
+            except KeyError:
+                raise ValueError("Non Implemented model_id found in Azure OCR result.")
+            self._raw_text_cache = extract_raw_text(self._root)
+        return self._raw_text_cache
+
+    @require_azure_ocr_result
+    def get_contents_from_page(
+        self,
+        page_number: int = -1,
+        minimal_confidence: float = 0.0,
+        only: tuple[str, ...] = ("words", "lines", "selection_marks"),
+    ) -> AzureDocIntelPageContents:
+        """Given a page number, return the words, lines and selection marks found in the page in a single pass over
+        the pages. Use this instead of calling the separate getters when more than one of them is needed.
+
+        NOTE: page numbers start at 1.
+        NOTE: lines in Azure Document Intelligence do not have a confidence value, so minimal_confidence is only
+              applied to words and selection marks.
+
+        Args:
+            page_number (int): The page number to extract contents from. -1 to get all pages.
+            minimal_confidence (float, optional): The minimal confidence level to extract words and selection marks.
+                                                  Defaults to 0.0.
+            only (tuple[str, ...], optional): The contents to extract, any of "words", "lines" and "selection_marks".
+                                              Defaults to all of them.
+
+        Returns:
+            AzureDocIntelPageContents: The words, lines and selection marks found in the page.
+
+        Raises:
+            ValueError: If the page number is invalid, or if `only` contains an unknown content.
+        """
+
+        CONTENTS = ("words", "lines", "selection_marks")
+
+        self.__check_page_number(page_number)
+        unknown_contents = [content for content in only if content not in CONTENTS]
+        if unknown_contents:
+            raise ValueError(f"Invalid contents {unknown_contents}. Contents must be any of {CONTENTS}.")
+
+        with_words = "words" in only
+        with_lines = "lines" in only
+        with_selection_marks = "selection_marks" in only
+
+        words = []
+        lines = []
+        selection_marks = []
+
+        for page_arrays in self.__iter_page_arrays(page_number):
+            if with_words:
+                words.extend(page_arrays.get_words(minimal_confidence).tolist())
+            if with_lines:
+                lines.extend(page_arrays.line_content.tolist())
+            if with_selection_marks:
+                selection_marks.extend(page_arrays.get_selection_marks(minimal_confidence).tolist())
+
+        return AzureDocIntelPageContents.model_construct(words=words, lines=lines, selection_marks=selection_marks)
+
+    @require_azure_ocr_result
+    def iter_words_from_page(self, page_number: int = -1, minimal_confidence: float = 0.0) -> Iterator[str]:
+        """Given a page number, lazily yield the words found in the page. Prefer this over `get_words_from_page` when
+        the words are only iterated once.
+
+        NOTE: page numbers start at 1.
+
+        Args:
+            page_number (int): The page number to extract words from. -1 to get all pages.
+            minimal_confidence (float, optional): The minimal confidence level to extract words. Defaults to 0.0.
+
+        Returns:
+            Iterator[str]: A generator over the words found in the page.
+
+        Raises:
+            ValueError: If the page number is invalid.
+        """
+
+        # check if the page_number is valid
+        self.__check_page_number(page_number)
+
+        return (
+            word
+            for page_arrays in self.__iter_page_arrays(page_number)
+            for word in page_arrays.get_words(minimal_confidence)
+        )
 
     @require_azure_ocr_result
     def get_words_from_page(self, page_number: int = -1, minimal_confidence: float = 0.0) -> list[str]:
@@ -172,20 +550,27 @@ class AzureOCR:
             list: A list of words found in the page.
         """
 
-        # check if the page_number is valid
-        if page_number != -1:
-            if (page_number == 0 or
-                    page_number < -1 or
-                    page_number > self.max_page_count):
-                raise ValueError(f"Invalid page number. Page number must be between 1 and {self.result['analyzeResult']['pageCount']}.")
+        return list(self.iter_words_from_page(page_number, minimal_confidence))
 
-        words = []
-        for page in self.result["analyzeResult"]["pages"]:
-            if page_number == -1 or page["page"] == page_number:
-                for word in page["words"]:
-                    if word["confidence"] >= minimal_confidence:
-                        words.append(word["content"])
-        return words
+    @require_azure_ocr_result
+    def iter_selection_marks_from_page(self, page_number: int = -1, minimal_confidence: float = 0.0) -> Iterator[bool]:
+        """Given a page number, lazily yield the selection marks found in the page.
+
+        NOTE: page numbers start at 1.
+
+        Args:
+            page_number (int): The page number to extract selection marks from. -1 to get all pages.
+            minimal_confidence (float, optional): The minimal confidence level to extract selection marks. Defaults to 0.0.
+
+        Returns:
+            Iterator[bool]: A generator over the selection marks found in the page, True if selected.
+        """
+
+        return (
+            selection_mark
+            for page_arrays in self.__iter_page_arrays(page_number)
+            for selection_mark in page_arrays.get_selection_marks(minimal_confidence).tolist()
+        )
 
     @require_azure_ocr_result
     def get_selection_marks_from_page(self, page_number: int = -1, minimal_confidence: float = 0.0) -> list[bool]:
@@ -201,19 +586,23 @@ class AzureOCR:
             list: A list of selection marks found in the page.
         """
 
-        selection_marks = []
+        return list(self.iter_selection_marks_from_page(page_number, minimal_confidence))
 
-        page_nested_obj = self.__get_nested_obj_for_key("pages")
-        if page_nested_obj is None:
-            # no pages found
-            return selection_marks
+    @require_azure_ocr_result
+    def iter_lines_from_page(self, page_number: int = -1) -> Iterator[str]:
+        """Given a page number, lazily yield the lines found in the page.
+
+        NOTE: page numbers start at 1.
+        NOTE: lines in Azure Document Intelligence do not have a confidence value.
 
-        for page in page_nested_obj:
-            if page_number == -1 or page["page"] == page_number:
-                for selection_mark in page["selectionMarks"]:
-                    if selection_mark["confidence"] >= minimal_confidence:
-                        selection_marks.append(selection_mark["state"] == "selected")
-        return selection_marks
+        Args:
+            page_number (int): The page number to extract lines from. -1 to get all pages.
+
+        Returns:
+            Iterator[str]: A generator over the lines found in the page.
+        """
+
+        return (line for page_arrays in self.__iter_page_arrays(page_number) for line in page_arrays.line_content)
 
     @require_azure_ocr_result
     def get_lines_from_page(self, page_number: int = -1) -> list[str]:
@@ -229,18 +618,44 @@ class AzureOCR:
             list: A list of lines found in the page.
         """
 
-        lines = []
+        return list(self.iter_lines_from_page(page_number))
 
-        page_nested_obj = self.__get_nested_obj_for_key("pages")
-        if page_nested_obj is None:
-            # no pages found
-            return lines
+    @require_azure_ocr_result
+    def iter_tables_from_page(self, page_number: int = -1) -> Iterator[AzureDocIntelTable]:
+        """Given a page number, lazily yield the tables found in the page.
+
+        NOTE: page numbers start at 1.
 
-        for page in page_nested_obj:
-            if page_number == -1 or page["page"] == page_number:
-                for line in page["lines"]:
-                    lines.append(line["content"])
-        return lines
+        Args:
+            page_number (int): The page number to extract tables from. -1 to get all pages.
+
+        Returns:
+            Iterator[AzureDocIntelTable]: A generator over the tables found in the page.
+        """
+
+        # the OCR result is trusted, so skip the pydantic validation of every cell and table
+        new_cell = AzureDocIntelTableCell.model_construct
+        new_table = AzureDocIntelTable.model_construct
+        filter_cells = page_number != -1
+
+        for table in self.__get_items_from_page("tables", page_number):
+            azure_cells = []
+            append_cell = azure_cells.append
+            for cell in table["cells"]:
+                if not filter_cells or cell["boundingRegions"][0]["pageNumber"] == page_number:
+                    append_cell(
+                        new_cell(
+                            row_index=cell["rowIndex"],
+                            column_index=cell["columnIndex"],
+                            is_header="kind" in cell,
+                            text=cell["content"],
+                        )
+                    )
+            yield new_table(
+                row_count=table["rowCount"],
+                column_count=table["columnCount"],
+                cells=tuple(azure_cells)
+            )
 
     @require_azure_ocr_result
     def get_tables_from_page(self, page_number: int = -1) -> list[AzureDocIntelTable]:
@@ -255,41 +670,14 @@ class AzureOCR:
             list: A list of tables found in the page.
         """
 
-        tables = []
-
-        tables_nested_obj = self.__get_nested_obj_for_key("tables")
-        if tables_nested_obj is None:
-            # no pages found
-            return tables
-
-        for table in tables_nested_obj:
-            # TODO: check if there is every a case where a table spans multiple pages
-            if page_number == -1 or table["boundingRegions"][0]["pageNumber"] == page_number:
-                azure_cells = []
-                for cell in table["cells"]:
-                    if page_number == -1 or cell["boundingRegions"][0]["pageNumber"] == page_number:
-                        azure_cells.append(
-                            AzureDocIntelTableCell(
-                                row_index=cell["rowIndex"],
-                                column_index=cell["columnIndex"],
-                                is_header="kind" in cell,
-                                text=cell["content"],
-                            )
-                        )
-                tables.append(
-                    AzureDocIntelTable(
-                        row_count=table["rowCount"],
-                        col_count=table["columnCount"],
-                        cells=azure_cells
-                    )
-                )
-        return tables
+        return list(self.iter_tables_from_page(page_number))
 
     @require_azure_ocr_result
     def get_key_value_pairs_from_page(self, page_number: int = -1) -> dict:
         """Given a page number, return a dictionary of key value pairs found in the page.
 
         NOTE: page numbers start at 1.
+        NOTE: keys found without a value are mapped to None.
 
         Args:
             page_number (int): The page number to extract key value pairs from. -1 to get all pages.
@@ -300,16 +688,10 @@ class AzureOCR:
 
         key_value_pairs = {}
 
-        kv_nested_obj = self.__get_nested_obj_for_key("keyValuePairs")
-        if kv_nested_obj is None:
-            # no pages found
-            return key_value_pairs
-
-        for key_value_pair in kv_nested_obj:
-            if page_number == -1 or key_value_pair["boundingRegions"][0]["pageNumber"] == page_number:
-                key = key_value_pair["key"]["content"]
-                value = key_value_pair["value"]["content"]
-                key_value_pairs[key] = value
+        for key_value_pair in self.__get_items_from_page("keyValuePairs", page_number):
+            key = key_value_pair["key"]["content"]
+            value = key_value_pair.get("value")
+            key_value_pairs[key] = value["content"] if value is not None else None
         return key_value_pairs
 
     @require_azure_ocr_result
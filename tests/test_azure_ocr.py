@@ -1,7 +1,13 @@
 import pytest
 from src.azure_ocr_lib import AzureOCR
+import io
+import json
 import os
 
+import requests
+from requests.structures import CaseInsensitiveDict
+import urllib3
+
 @pytest.fixture
 def azure_ocr():
     return AzureOCR("https://test-endpoint.cognitiveservices.azure.com/", "test-api-key")
@@ -17,18 +23,85 @@ def test_analyze_document_result_none(azure_ocr):
     # confirm that the result is None when the class is created but no analysis has been done
     assert azure_ocr.result is None
 
-def test_analyze_document_result_not_none(azure_ocr):
-    assert 1 == 1
+@pytest.fixture
+def sent_requests(monkeypatch):
+    # answer the analyze request and its polling request with the generaldoc result, without reaching Azure
+    with open("tests/data/ocr/generaldoc-drillreport.json", "rb") as f:
+        analyze_response = f.read()
+    sent_requests = []
+
+    def send(session, request, **kwargs):
+        sent_requests.append(request)
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        if request.method == "POST":
+            response.status_code = 202
+            response.headers = CaseInsensitiveDict({
+                "Operation-Location": f"{request.url.split(':analyze')[0]}/analyzeResults/test-result-id",
+                "Retry-After": "0",
+            })
+            response.raw = urllib3.HTTPResponse(body=io.BytesIO(b""), status=202, preload_content=False)
+        else:
+            response.status_code = 200
+            response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+            response.raw = urllib3.HTTPResponse(body=io.BytesIO(analyze_response), status=200, preload_content=False)
+        return response
+
+    monkeypatch.setattr(requests.Session, "send", send)
+    return sent_requests
+
+def test_analyze_document_result_not_none(azure_ocr, sent_requests):
     # confirm that the result is not None after the analysis has been done
-    # TODO: Mocking the actual analysis
-    # azure_ocr.analyze_document("tests/data/ocr/generaldoc-drillreport.pdf")
-    # assert azure_ocr.result is not None
+    azure_ocr.analyze_document("tests/data/ocr/generaldoc-drillreport.json")
+    assert azure_ocr.result is not None
+    assert len(azure_ocr.get_words_from_page()) > 0
+
+def test_analyze_document_uploads_document(azure_ocr, sent_requests):
+    # the document is uploaded as a single bytes object
+    azure_ocr.analyze_document("tests/data/ocr/generaldoc-drillreport.json")
+    with open("tests/data/ocr/generaldoc-drillreport.json", "rb") as f:
+        assert sent_requests[0].body == f.read()
+    assert sent_requests[0].headers["Content-Type"] == "application/octet-stream"
+
+def test_client_shared_across_instances(azure_ocr):
+    # instances for the same endpoint and API key reuse the same client (and HTTP pipeline)
+    other_azure_ocr = AzureOCR("https://test-endpoint.cognitiveservices.azure.com/", "test-api-key")
+    assert other_azure_ocr._AzureOCR__doc_intel_client is azure_ocr._AzureOCR__doc_intel_client
+
+def test_session_shared_across_clients(azure_ocr, sent_requests, monkeypatch):
+    # clients for different API keys still send their requests through the same session
+    sessions = []
+    send = requests.Session.send
+
+    def record_session(session, request, **kwargs):
+        sessions.append(session)
+        return send(session, request, **kwargs)
+
+    monkeypatch.setattr(requests.Session, "send", record_session)
+    other_azure_ocr = AzureOCR("https://test-endpoint.cognitiveservices.azure.com/", "other-test-api-key")
+    assert other_azure_ocr._AzureOCR__doc_intel_client is not azure_ocr._AzureOCR__doc_intel_client
+
+    azure_ocr.analyze_document("tests/data/ocr/generaldoc-drillreport.json")
+    other_azure_ocr.analyze_document("tests/data/ocr/generaldoc-drillreport.json")
+    assert len(sessions) == 4
+    assert all(session is sessions[0] for session in sessions)
 
 def test_load_azure_ocr_json_valid_json(azure_ocr):
     # confirm that the result is not None after loading the json
     azure_ocr.load_azure_ocr_json("tests/data/ocr/generaldoc-drillreport.json")
     assert azure_ocr.result is not None
 
+def test_load_azure_ocr_json_large_json(azure_ocr, azure_ocr_json, tmp_path):
+    # files above 1MB are memory mapped instead of read
+    with open("tests/data/ocr/generaldoc-drillreport.json", "rb") as f:
+        content = f.read()
+    filename = tmp_path / "large-generaldoc-drillreport.json"
+    filename.write_bytes(content + b" " * (1024 * 1024))
+
+    azure_ocr.load_azure_ocr_json(str(filename))
+    assert azure_ocr.get_words_from_page() == azure_ocr_json.get_words_from_page()
+
 def test_load_azure_ocr_json_invalid_json(azure_ocr):
     with pytest.raises(FileNotFoundError):
         azure_ocr.load_azure_ocr_json("tests/data/ocr/nonexistent.json")
@@ -37,6 +110,17 @@ def test_load_azure_ocr_json_invalid_json_content(azure_ocr):
     with pytest.raises(ValueError):
         azure_ocr.load_azure_ocr_json("tests/data/ocr/invalid_ocr.json")
 
+def test_load_azure_ocr_json_streaming_valid_json(azure_ocr, azure_ocr_json):
+    azure_ocr.load_azure_ocr_json_streaming("tests/data/ocr/generaldoc-drillreport.json")
+    assert azure_ocr.result is not None
+    # streamed pages are re-read on every call
+    assert azure_ocr.get_words_from_page() == azure_ocr_json.get_words_from_page()
+    assert azure_ocr.get_words_from_page() == azure_ocr_json.get_words_from_page()
+
+def test_load_azure_ocr_json_streaming_invalid_json(azure_ocr):
+    with pytest.raises(FileNotFoundError):
+        azure_ocr.load_azure_ocr_json_streaming("tests/data/ocr/nonexistent.json")
+
 def test_save_azure_ocr_json(azure_ocr_json):
     filename = "tests/data/ocr/test_generaldoc-drillreport.json"
 
@@ -45,6 +129,20 @@ def test_save_azure_ocr_json(azure_ocr_json):
     # delete file after test
     os.remove(filename)
 
+def test_save_azure_ocr_json_analyzed(azure_ocr, azure_ocr_json, sent_requests, tmp_path):
+    # the raw analyze response is saved as is, so reloading it gives back the same result
+    azure_ocr.analyze_document("tests/data/ocr/generaldoc-drillreport.json")
+    filename = tmp_path / "test_generaldoc-drillreport.json"
+    azure_ocr.save_azure_ocr_json(str(filename))
+    with open("tests/data/ocr/generaldoc-drillreport.json", "rb") as f:
+        assert filename.read_bytes() == f.read()
+
+    reloaded = AzureOCR("https://test-endpoint.cognitiveservices.azure.com/", "test-api-key")
+    reloaded.load_azure_ocr_json(str(filename))
+    assert reloaded.result.as_dict() == azure_ocr_json.result.as_dict()
+    assert reloaded.get_words_from_page() == azure_ocr.get_words_from_page()
+    assert reloaded.get_key_value_pairs_from_page() == azure_ocr.get_key_value_pairs_from_page()
+
 def test_save_azure_ocr_json_result_none(azure_ocr):
     # since no analysis has been done, there is no result to save
     with pytest.raises(ValueError):
@@ -55,12 +153,29 @@ def test_save_azure_ocr_json_no_result(azure_ocr):
     with pytest.raises(ValueError):
         azure_ocr.save_azure_ocr_json("tests/data/ocr/test_generaldoc-drillreport.json")
 
+def test_save_azure_ocr_json_streaming(azure_ocr, tmp_path):
+    # a streamed result only holds the scalars in memory, saving it would write a truncated file
+    azure_ocr.load_azure_ocr_json_streaming("tests/data/ocr/generaldoc-drillreport.json")
+    filename = tmp_path / "test_generaldoc-drillreport.json"
+    with pytest.raises(ValueError):
+        azure_ocr.save_azure_ocr_json(str(filename))
+    assert not filename.exists()
+
 # TODO: test __gest_nested_obj_for_key
 # TODO: test __update_max_page_count
 
 def test_get_raw_text_valid(azure_ocr_json):
     assert azure_ocr_json.get_raw_text() == "This is a test document for Azure OCR."
 
+def test_get_raw_text_prebuilt_layout(azure_ocr):
+    azure_ocr.load_azure_ocr_json("tests/data/ocr/single_line_test_document_layout.json")
+    assert azure_ocr.get_raw_text() == "This is a test document for Azure OCR."
+
+def test_get_raw_text_missing_model_id(azure_ocr):
+    azure_ocr.load_azure_ocr_json("tests/data/ocr/invalid_ocr.json")
+    with pytest.raises(ValueError):
+        azure_ocr.get_raw_text()
+
 def test_get_raw_text_no_result(azure_ocr):
     with pytest.raises(ValueError):
         azure_ocr.get_raw_text()
@@ -88,13 +203,93 @@ def test_get_words_from_page_above_max_page(azure_ocr_json):
     with pytest.raises(ValueError):
         azure_ocr_json.get_words_from_page(999)
 
+def test_max_page_count_valid(azure_ocr, azure_ocr_json):
+    # derived from the page numbers once at load, for both loaders
+    assert azure_ocr_json.max_page_count == 1
+    azure_ocr.load_azure_ocr_json_streaming("tests/data/ocr/generaldoc-drillreport.json")
+    assert azure_ocr.max_page_count == 1
+
+def test_get_words_from_page_invalid_page_message(azure_ocr_json):
+    with pytest.raises(ValueError, match="between 1 and 1"):
+        azure_ocr_json.get_words_from_page(2)
+
 def test_get_words_from_page_below_min_confidence(azure_ocr_json):
     words = azure_ocr_json.get_words_from_page(1, min_confidence=1.0)
     assert len(words) == 0
 
+def test_iter_words_from_page_valid(azure_ocr_json):
+    words = azure_ocr_json.iter_words_from_page(1, minimal_confidence=0.5)
+    assert not isinstance(words, list)
+    assert list(words) == azure_ocr_json.get_words_from_page(1, minimal_confidence=0.5)
+
+def test_iter_words_from_page_above_max_page(azure_ocr_json):
+    # the page number is checked when the generator is created, not when it is first iterated
+    with pytest.raises(ValueError):
+        azure_ocr_json.iter_words_from_page(999)
+
+def test_iter_tables_from_page_valid(azure_ocr_json):
+    tables = list(azure_ocr_json.iter_tables_from_page())
+    assert [table.cells for table in tables] == [table.cells for table in azure_ocr_json.get_tables_from_page()]
+
+def test_get_contents_from_page_valid(azure_ocr_json):
+    contents = azure_ocr_json.get_contents_from_page(minimal_confidence=0.5)
+    assert contents.words == azure_ocr_json.get_words_from_page(minimal_confidence=0.5)
+    assert contents.lines == azure_ocr_json.get_lines_from_page()
+    assert contents.selection_marks == azure_ocr_json.get_selection_marks_from_page(minimal_confidence=0.5)
+
+def test_get_contents_from_page_only(azure_ocr_json):
+    contents = azure_ocr_json.get_contents_from_page(only=("lines",))
+    assert len(contents.lines) > 0
+    assert contents.words == []
+    assert contents.selection_marks == []
+
+def test_get_contents_from_page_missing_page(azure_ocr_json):
+    with pytest.raises(ValueError):
+        azure_ocr_json.get_contents_from_page(999)
+
+def test_get_contents_from_page_invalid_only(azure_ocr_json):
+    with pytest.raises(ValueError):
+        azure_ocr_json.get_contents_from_page(only=("word",))
+
 # TODO: get_selection_marks_from_page
 # TODO: get_lines_from_page
-# TODO: get_tables_from_page
-# TODO: get_key_value_pairs_from_page
+def test_get_tables_from_page_valid(azure_ocr_json):
+    tables = azure_ocr_json.get_tables_from_page(1)
+    assert len(tables) == 5
+    assert tables[0].column_count == 2
+    assert [cell.text for cell in tables[0].get_row(0)] == ["1. PROPOSAL TO DRILL", "2. BSEE OPERATOR NO."]
+
+def test_get_tables_from_page_missing_page(azure_ocr_json):
+    assert azure_ocr_json.get_tables_from_page(999) == []
+
+def test_get_key_value_pairs_from_page_valid(azure_ocr_json):
+    key_value_pairs = azure_ocr_json.get_key_value_pairs_from_page(1)
+    assert key_value_pairs["2. BSEE OPERATOR NO."] == "77337"
+    assert key_value_pairs == azure_ocr_json.get_key_value_pairs_from_page()
+
+def test_get_key_value_pairs_from_page_missing_value(azure_ocr_json):
+    # keys found without a value are kept, mapped to None
+    key_value_pairs = azure_ocr_json.get_key_value_pairs_from_page()
+    assert key_value_pairs["19. BLOCK NO."] is None
+
+def test_get_key_value_pairs_from_page_missing_page(azure_ocr_json):
+    assert azure_ocr_json.get_key_value_pairs_from_page(999) == {}
+
+def test_load_azure_ocr_json_no_bounding_regions(azure_ocr, tmp_path):
+    # results of Office documents have no bounding regions, their tables and key value pairs are not on any page
+    with open("tests/data/ocr/generaldoc-drillreport.json") as f:
+        content = json.load(f)
+    for item in content["analyzeResult"]["tables"]:
+        del item["boundingRegions"]
+    for item in content["analyzeResult"]["keyValuePairs"]:
+        del item["key"]["boundingRegions"]
+    filename = tmp_path / "no-bounding-regions-drillreport.json"
+    filename.write_text(json.dumps(content))
+
+    azure_ocr.load_azure_ocr_json(str(filename))
+    assert azure_ocr.get_tables_from_page(1) == []
+    assert len(azure_ocr.get_tables_from_page()) == 5
+    assert azure_ocr.get_key_value_pairs_from_page(1) == {}
+    assert len(azure_ocr.get_key_value_pairs_from_page()) > 0
 # TODO: get_specific_words_from_page
 
@@ -0,0 +1,62 @@
+from src.azure_ocr_lib._models import AzureDocIntelTableCell, AzureDocIntelTable, AzureDocIntelPage
+from pydantic import ValidationError
+import pytest
+
+@pytest.fixture
+def azure_table():
+    cells = [
+        AzureDocIntelTableCell(row_index=row, column_index=col, is_header=row == 0, text=f"{row}-{col}")
+        for row in range(3)
+        for col in range(2)
+    ]
+    return AzureDocIntelTable(row_count=3, column_count=2, cells=cells)
+
+def test_get_row_valid(azure_table):
+    row = azure_table.get_row(1)
+    assert [cell.text for cell in row] == ["1-0", "1-1"]
+
+def test_get_row_out_of_range(azure_table):
+    assert azure_table.get_row(999) == []
+
+def test_get_column_valid(azure_table):
+    column = azure_table.get_column(1)
+    assert [cell.text for cell in column] == ["0-1", "1-1", "2-1"]
+
+def test_get_column_out_of_range(azure_table):
+    assert azure_table.get_column(999) == []
+
+def test_table_frozen(azure_table):
+    assert isinstance(azure_table.cells, tuple)
+    with pytest.raises(ValidationError):
+        azure_table.row_count = 999
+
+def test_page_from_page_valid():
+    page = {
+        "words": [{"content": "Azure", "confidence": 0.9}, {"content": "OCR.", "confidence": 0.5}],
+        "lines": [{"content": "Azure OCR."}],
+        "selectionMarks": [{"state": "selected", "confidence": 0.8}, {"state": "unselected", "confidence": 0.7}],
+    }
+    azure_page = AzureDocIntelPage.from_page(page)
+    assert azure_page.word_content.tolist() == ["Azure", "OCR."]
+    assert azure_page.word_confidence.tolist() == pytest.approx([0.9, 0.5])
+    assert azure_page.line_content.tolist() == ["Azure OCR."]
+    assert azure_page.selection_mark_state.tolist() == [True, False]
+
+def test_page_from_page_missing_keys():
+    azure_page = AzureDocIntelPage.from_page({})
+    assert len(azure_page.word_content) == 0
+    assert len(azure_page.line_content) == 0
+    assert len(azure_page.selection_mark_state) == 0
+
+def test_page_get_words_valid():
+    page = {"words": [{"content": str(confidence), "confidence": confidence} for confidence in (0.1, 0.5, 0.979, 1.0)]}
+    azure_page = AzureDocIntelPage.from_page(page)
+    assert azure_page.get_words(0.5).tolist() == ["0.5", "0.979", "1.0"]
+
+def test_page_get_selection_marks_valid():
+    page = {"selectionMarks": [{"state": "selected", "confidence": 0.8}, {"state": "unselected", "confidence": 0.7}]}
+    azure_page = AzureDocIntelPage.from_page(page)
+    assert azure_page.get_selection_marks(0.75).tolist() == [True]
+
+def test_page_get_words_empty():
+    assert len(AzureDocIntelPage.from_page({}).get_words(0.5)) == 0